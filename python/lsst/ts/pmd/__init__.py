@@ -28,3 +28,7 @@ from .csc import *
 from .component import *
 from .mock_server import *
 from .config_schema import *
+from .statistics import *
+from .polling import *
+from .tracing import *
+from .log_utils import *
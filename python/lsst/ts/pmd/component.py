@@ -28,7 +28,9 @@ import logging
 
 import serial
 
+from .log_utils import report_suppressed, set_rate_limit
 from .mock_server import MockSerial
+from .tracing import Tracer
 
 SIMULATION_SERIAL_PORT = "/dev/ttyUSB0"
 READ_TIMEOUT = 10.0  # [seconds]
@@ -43,6 +45,11 @@ class MitutoyoComponent:
     ----------
     simulation_mode : `bool`
         Whether the component is in simulation mode.
+    log : `logging.Logger`, optional
+        The parent logger.
+    tracer : `Tracer`, optional
+        Records spans of the serial exchanges; tracing is disabled if
+        not specified.
 
     Attributes
     ----------
@@ -50,9 +57,14 @@ class MitutoyoComponent:
         The position of the device.
     connected : `bool`
         Whether the device is connected.
+    slot_logs : `list` of `logging.Logger`
+        A child logger for each slot, so that debug messages of a single
+        slot can be enabled.
+    mock_log : `logging.Logger`
+        The logger of the mock serial device.
     """
 
-    def __init__(self, simulation_mode, log=None):
+    def __init__(self, simulation_mode, log=None, tracer=None):
         self.connected = False
         self.simulation_mode = bool(simulation_mode)
         self.names = ["", "", "", "", "", "", "", ""]
@@ -60,6 +72,9 @@ class MitutoyoComponent:
             self.log = logging.getLogger(type(self).__name__)
         else:
             self.log = log.getChild(type(self).__name__)
+        self.slot_logs = [self.log.getChild(f"slot{i + 1}") for i in range(8)]
+        self.mock_log = self.log.getChild("mock")
+        self.tracer = tracer if tracer is not None else Tracer()
 
     def connect(self):
         """Connect to the device."""
@@ -75,7 +90,7 @@ class MitutoyoComponent:
         else:
             main, reader = pty.openpty()
             self.log.debug("Creating MOCK serial connection")
-            self.commander = MockSerial(os.ttyname(main))
+            self.commander = MockSerial(os.ttyname(main), log=self.mock_log)
 
         self.connected = True
         self.log.debug("Connection to device completed")
@@ -85,6 +100,8 @@ class MitutoyoComponent:
         self.log.debug("Disconnecting serial device")
         self.commander.close()
         self.connected = False
+        for log in [self.log, self.mock_log] + self.slot_logs:
+            report_suppressed(log)
 
     def configure(self, config):
         """Configure the device.
@@ -100,16 +117,38 @@ class MitutoyoComponent:
         self.units = config["units"]
         self.location = config["location"]
         self.serial_port = config["serial_port"]
+        self.configure_logging(config.get("logging", {}))
 
         self.log.debug("Configuration completed")
 
-    def send_msg(self, msg):
+    def configure_logging(self, config):
+        """Configure the verbosity of the component loggers.
+
+        Parameters
+        ----------
+        config : `dict`
+            The ``logging`` section of the hub configuration. Loggers
+            without a configured level inherit the level of the CSC.
+        """
+        self.log.setLevel(config.get("component_level", logging.NOTSET))
+        self.mock_log.setLevel(config.get("mock_level", logging.NOTSET))
+        debug_slots = config.get("debug_slots", [])
+        for i, slot_log in enumerate(self.slot_logs):
+            slot_log.setLevel(logging.DEBUG if i + 1 in debug_slots else logging.NOTSET)
+        rate_limit = config.get("rate_limit", 10)
+        for log in [self.log, self.mock_log] + self.slot_logs:
+            set_rate_limit(log, rate_limit)
+
+    def send_msg(self, msg, log=None):
         """Send a message to the device.
 
         Parameters
         ----------
         msg : `str`
             The message to send.
+        log : `logging.Logger`, optional
+            The logger for debug messages; defaults to the component
+            logger.
 
         Raises
         ------
@@ -124,16 +163,17 @@ class MitutoyoComponent:
 
         if not self.connected:
             raise Exception("Not connected")
-        self.log.debug(f"Message to be sent is {msg}")
+        if log is None:
+            log = self.log
+        log.debug("Message to be sent is %s", msg)
         self.commander.write(f"{msg}\r".encode())
-        self.log.debug("Message written")
         try:
             reply = self.commander.read_until(b"\r")
-            self.log.debug(f"Read successful in send_msg, got {reply}")
+            log.debug("Read successful in send_msg, got %s", reply)
             return reply
         except TimeoutError:
             reply = b"\r"
-            self.log.debug(f"Timed out on read in send_msg, returning {reply}")
+            log.debug("Timed out on read in send_msg, returning %s", reply)
             return reply
 
     def get_slots_position(self):
@@ -165,10 +205,12 @@ class MitutoyoComponent:
         for i, name in enumerate(self.names):
             if name == "":
                 continue
-            reply = self.send_msg(str(i + 1))
-            if reply != b"\r":
-                split_reply = reply.decode().split(":")
-                position[i] = float(split_reply[-1])
-            else:
-                position[i] = math.nan
+            with self.tracer.span("send_msg", slot=i + 1):
+                reply = self.send_msg(str(i + 1), log=self.slot_logs[i])
+            with self.tracer.span("parse", slot=i + 1):
+                if reply != b"\r":
+                    split_reply = reply.decode().split(":")
+                    position[i] = float(split_reply[-1])
+                else:
+                    position[i] = math.nan
         return position
@@ -10,6 +10,9 @@ $id: https://github.com/lsst-ts/ts_pmd/blob/master/schema/PMDevice.yaml
 title: PMD v1
 description: Schema for PMD configuration files
 definitions:
+  log_level:
+    type: string
+    enum: ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]
   hub_specific_schema:
     type: object
     properties:
@@ -45,6 +48,93 @@ definitions:
         description: The brand/type of device hub.
         enum: ["Mitutoyo"]
         default: "Mitutoyo"
+      adaptive_polling:
+        type: object
+        description: >-
+          Adapt the polling interval to detected motion. While static, the hub
+          is polled every telemetry_interval; when the rate of change of any
+          slot exceeds threshold, it is polled every min_interval. The rate
+          of change is measured over at least telemetry_interval. Position
+          statistics are still sampled only every telemetry_interval, so
+          moving periods are not oversampled.
+        properties:
+          enabled:
+            type: boolean
+            description: Enable adaptive polling.
+            default: false
+          min_interval:
+            type: number
+            description: The fastest polling interval, limited by the hub. (Seconds)
+            exclusiveMinimum: 0
+            default: 0.1
+          threshold:
+            type: number
+            description: The rate of change above which a slot is considered moving. (Units per second)
+            minimum: 0
+            default: 1
+          decay:
+            type: number
+            description: The factor the interval grows by each cycle once the readings settle.
+            exclusiveMinimum: 1
+            default: 2
+        additionalProperties: false
+      tracing:
+        type: object
+        description: >-
+          Record spans of each telemetry cycle, serial exchange, parse and
+          publish, and write them to a Chrome trace file that can be viewed
+          with chrome://tracing or Perfetto.
+        properties:
+          enabled:
+            type: boolean
+            description: Enable tracing.
+            default: false
+          path:
+            type: string
+            description: >-
+              The absolute path of the trace file; spans are appended to it.
+              If it cannot be written, a warning is logged and tracing is
+              disabled.
+            default: "/tmp/pmd_trace.json"
+          flush_interval:
+            type: number
+            description: The interval at which spans are written to the trace file. (Seconds)
+            exclusiveMinimum: 0
+            default: 10
+          max_events:
+            type: integer
+            description: The maximum number of spans buffered between flushes; older spans are dropped.
+            minimum: 1
+            default: 100000
+        additionalProperties: false
+      logging:
+        type: object
+        description: >-
+          Verbosity of the acquisition path. Loggers without a configured
+          level inherit the log level of the CSC.
+        properties:
+          component_level:
+            $ref: "#/definitions/log_level"
+            description: The log level of the hub component.
+          mock_level:
+            $ref: "#/definitions/log_level"
+            description: The log level of the simulated serial device.
+          debug_slots:
+            type: array
+            description: Slots (1-8) whose serial exchanges are logged at debug level.
+            items:
+              type: integer
+              minimum: 1
+              maximum: 8
+            default: []
+          rate_limit:
+            type: integer
+            description: >-
+              The maximum number of identical debug messages per second
+              from each logger; 0 disables rate limiting.
+            minimum: 0
+            default: 10
+        additionalProperties: false
     required: [telemetry_interval, devices, units,  location, serial_port, hub_type]
     additionalProperties: false
 type: object
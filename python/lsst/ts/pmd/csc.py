@@ -28,6 +28,9 @@ from lsst.ts import salobj
 from . import __version__
 from .component import MitutoyoComponent
 from .config_schema import CONFIG_SCHEMA
+from .polling import AdaptiveInterval
+from .statistics import PositionStatistics
+from .tracing import Tracer
 
 
 class PMDCsc(salobj.ConfigurableCsc):
@@ -50,8 +53,16 @@ class PMDCsc(salobj.ConfigurableCsc):
         The task for running the telemetry loop.
     telemetry_interval : `float`
         The interval that telemetry is published at. (Seconds)
+    adaptive_interval : `AdaptiveInterval` or `None`
+        Computes the polling interval from detected motion, or `None` if
+        adaptive polling is disabled.
+    tracer : `Tracer`
+        Records spans of each telemetry cycle when tracing is enabled.
     component : `MitutoyoComponent`
         The component for the PMD.
+    statistics : `PositionStatistics` or `None`
+        The running statistics of the slot positions, or `None` if
+        statistics are not being accumulated.
     """
 
     valid_simulation_modes = (0, 1)
@@ -78,8 +89,11 @@ class PMDCsc(salobj.ConfigurableCsc):
         )
         self.telemetry_task = salobj.make_done_future()
         self.telemetry_interval = 1
+        self.adaptive_interval = None
+        self.tracer = Tracer()
         self.index = index
         self.component = None
+        self.statistics = None
 
     async def configure(self, config):
         """Configure the CSC.
@@ -90,11 +104,37 @@ class PMDCsc(salobj.ConfigurableCsc):
             The configuration object.
         """
         self.log.info(config)
+        if self.statistics is not None:
+            # The sampling interval of the statistics depends on the
+            # configuration, so do not mix samples across configurations.
+            self.log.warning("Stopping position statistics before reconfiguring")
+            self.stop_statistics()
         self.telemetry_interval = config.hub_config[self.index - 1][
             "telemetry_interval"
         ]
+        adaptive_polling = config.hub_config[self.index - 1].get("adaptive_polling", {})
+        if adaptive_polling.get("enabled", False):
+            self.adaptive_interval = AdaptiveInterval(
+                max_interval=self.telemetry_interval,
+                min_interval=adaptive_polling.get("min_interval", 0.1),
+                threshold=adaptive_polling.get("threshold", 1),
+                decay=adaptive_polling.get("decay", 2),
+            )
+        else:
+            self.adaptive_interval = None
+        self.tracer.flush()
+        tracing = config.hub_config[self.index - 1].get("tracing", {})
+        self.tracer = Tracer(
+            enabled=tracing.get("enabled", False),
+            path=tracing.get("path", "/tmp/pmd_trace.json"),
+            flush_interval=tracing.get("flush_interval", 10),
+            max_events=tracing.get("max_events", 100000),
+            log=self.log,
+        )
         if config.hub_config[self.index - 1]["hub_type"] == "Mitutoyo":
-            self.component = MitutoyoComponent(self.simulation_mode, log=self.log)
+            self.component = MitutoyoComponent(
+                self.simulation_mode, log=self.log, tracer=self.tracer
+            )
         self.component.configure(config.hub_config[self.index - 1])
         self.evt_metadata.set_put(
             hubType=self.component.hub_type,
@@ -108,20 +148,77 @@ class PMDCsc(salobj.ConfigurableCsc):
         try:
             self.log.debug("Begin sending telemetry")
             while True:
-                position = self.component.get_slots_position()
-                self.log.debug(
-                    "telemetry_loop received position data, now publishing event"
-                )
-                self.tel_position.set_put(position=position)
+                with self.tracer.span("telemetry_cycle"):
+                    position = self.component.get_slots_position()
+                    self.log.debug(
+                        "telemetry_loop received position data, now publishing event"
+                    )
+                    with self.tracer.span("set_put"):
+                        self.tel_position.set_put(position=position)
+                await self.tracer.flush_if_due()
+                timestamp = salobj.current_tai()
+                if self.statistics is not None:
+                    self.statistics.add(position, timestamp)
+                if self.adaptive_interval is not None:
+                    interval = self.adaptive_interval.update(position, timestamp)
+                else:
+                    interval = self.telemetry_interval
                 position = None  # reset so it's easier to debug exceptions
-                await asyncio.sleep(self.telemetry_interval)
+                await asyncio.sleep(interval)
         except asyncio.CancelledError:
             self.log.info("Telemetry loop cancelled")
+            self.tracer.flush()
         except Exception as e:
             err_msg = f"Telemetry loop failed. Last position value was {position}"
             self.log.exception(err_msg)
+            self.tracer.flush()
             self.fault(2, report=f"{err_msg}: {e}")
 
+    def start_statistics(self):
+        """Start accumulating statistics of the slot positions.
+
+        Any statistics already being accumulated are discarded.
+        """
+        self.log.info("Starting position statistics")
+        # Sample the statistics at telemetry_interval even while adaptive
+        # polling is fast, so moving periods are not oversampled and the
+        # Allan deviation has a single averaging time.
+        if self.adaptive_interval is not None:
+            min_interval = (
+                self.telemetry_interval - self.adaptive_interval.min_interval / 2
+            )
+        else:
+            min_interval = 0
+        self.statistics = PositionStatistics(min_interval=min_interval)
+
+    def stop_statistics(self):
+        """Stop accumulating statistics of the slot positions and
+        log the summary.
+
+        Raises
+        ------
+        RuntimeError
+            Raised when statistics are not being accumulated.
+
+        Returns
+        -------
+        summary : `list` of `dict`
+            The summary of each slot, see `PositionStatistics.summary`.
+        """
+        if self.statistics is None:
+            raise RuntimeError("Statistics are not being accumulated")
+        statistics = self.statistics
+        self.statistics = None
+        summary = statistics.summary()
+        names = self.component.names if self.component is not None else None
+        self.log.info(f"Position statistics over {statistics.duration:0.1f} seconds")
+        for i, slot_summary in enumerate(summary):
+            if slot_summary["count"] == 0:
+                continue
+            name = names[i] if names is not None else ""
+            self.log.info(f"Slot {i + 1} ({name}): {slot_summary}")
+        return summary
+
     async def handle_summary_state(self):
         """Handle the summary states."""
         if self.disabled_or_enabled:
@@ -147,6 +244,7 @@ class PMDCsc(salobj.ConfigurableCsc):
         """Close the CSC for cleanup."""
         await super().close_tasks()
         self.telemetry_task.cancel()
+        self.tracer.flush()
         if self.component is not None:
             self.component.disconnect()
 
@@ -0,0 +1,164 @@
+# This file is part of ts_pmd.
+#
+# Developed for the Vera Rubin Telescope and Site Project.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["RateLimitFilter", "set_rate_limit", "report_suppressed"]
+
+import logging
+import time
+
+
+class RateLimitFilter(logging.Filter):
+    """Limit how often the same message is logged.
+
+    Records are grouped by logger name and unformatted message, so
+    messages that only differ by their arguments share a limit. Records
+    above ``level`` are never dropped. Each message has a one second
+    window; expired windows are swept at most once per second, when any
+    record is filtered, and for each window in which records were
+    dropped a record reporting how many were suppressed is logged.
+    Call `report` to log the pending counts immediately, e.g. before
+    removing the filter.
+
+    Parameters
+    ----------
+    rate : `int`
+        The maximum number of records per message per second.
+    level : `int`, optional
+        The highest level that is rate limited.
+
+    Attributes
+    ----------
+    suppressed : `int`
+        The number of records dropped so far.
+    """
+
+    def __init__(self, rate, level=logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.level = level
+        self.suppressed = 0
+        # key: [window start time, number of records, latest record]
+        self._windows = dict()
+        self._last_sweep = time.monotonic()
+
+    def filter(self, record):
+        if record.levelno > self.level or getattr(record, "rate_limit_report", False):
+            return True
+        now = time.monotonic()
+        if now - self._last_sweep >= 1:
+            self._last_sweep = now
+            self.report(expired_before=now - 1)
+        key = (record.name, record.msg)
+        window = self._windows.get(key)
+        if window is None:
+            window = [now, 0, record]
+            self._windows[key] = window
+        window[1] += 1
+        window[2] = record
+        if window[1] > self.rate:
+            self.suppressed += 1
+            return False
+        return True
+
+    def report(self, expired_before=None):
+        """Log the number of suppressed records of each window and
+        forget the windows.
+
+        Parameters
+        ----------
+        expired_before : `float` or `None`, optional
+            Only handle windows that started before this time
+            (`time.monotonic`); if `None`, handle all windows.
+        """
+        if expired_before is None:
+            expired = list(self._windows.items())
+        else:
+            expired = [
+                (key, window)
+                for key, window in self._windows.items()
+                if window[0] <= expired_before
+            ]
+        # Remove the windows before logging, in case a handler logs
+        # through this logger again.
+        for key, window in expired:
+            del self._windows[key]
+        for key, (start, count, record) in expired:
+            if count > self.rate:
+                self._report_suppressed(record, count - self.rate)
+
+    def _report_suppressed(self, record, num_suppressed):
+        """Log how many records of a message were dropped.
+
+        Parameters
+        ----------
+        record : `logging.LogRecord`
+            The latest record of the message.
+        num_suppressed : `int`
+            The number of records dropped in the window.
+        """
+        log = logging.getLogger(record.name)
+        log.handle(
+            log.makeRecord(
+                record.name,
+                record.levelno,
+                record.pathname,
+                record.lineno,
+                "Suppressed %d %r messages",
+                (num_suppressed, record.msg),
+                None,
+                extra=dict(rate_limit_report=True),
+            )
+        )
+
+
+def set_rate_limit(log, rate):
+    """Replace the `RateLimitFilter` of a logger.
+
+    The suppressed counts of the replaced filter are reported first.
+
+    Parameters
+    ----------
+    log : `logging.Logger`
+        The logger.
+    rate : `int`
+        The maximum number of records per message per second;
+        0 removes the rate limit.
+    """
+    for log_filter in list(log.filters):
+        if isinstance(log_filter, RateLimitFilter):
+            log.removeFilter(log_filter)
+            log_filter.report()
+    if rate > 0:
+        log.addFilter(RateLimitFilter(rate))
+
+
+def report_suppressed(log):
+    """Report the pending suppressed counts of the `RateLimitFilter` of a
+    logger.
+
+    Parameters
+    ----------
+    log : `logging.Logger`
+        The logger.
+    """
+    for log_filter in log.filters:
+        if isinstance(log_filter, RateLimitFilter):
+            log_filter.report()
@@ -43,6 +43,7 @@ class MockSerial(serial.Serial):
         dsrdtr=False,
         inter_byte_timeout=None,
         exclusive=None,
+        log=None,
     ):
         super().__init__(
             port=port,
@@ -58,26 +59,27 @@ class MockSerial(serial.Serial):
             inter_byte_timeout=inter_byte_timeout,
             exclusive=exclusive,
         )
-        self.log = logging.getLogger(__name__)
+        if log is None:
+            self.log = logging.getLogger(__name__)
+        else:
+            self.log = log
 
-        self.device = MockMitutoyoHub()
+        self.device = MockMitutoyoHub(log=self.log)
         self.message_queue = queue.Queue()
 
-        self.log.info("Mock Serial created.")
+        self.log.debug("Mock Serial created.")
 
     def read_until(self, character):
-        self.log.info("Reading from queue.")
+        self.log.debug("Reading from queue.")
         if not self.message_queue.empty():
             msg = self.message_queue.get()
             return msg.encode()
         raise Exception("Port timed out.")
 
     def write(self, data):
-        self.log.info(data)
         msg = self.device.parse_message(data)
-        self.log.debug(msg)
+        self.log.debug("Putting %r into queue", msg)
         self.message_queue.put(msg)
-        self.log.info("Putting into queue")
 
 
 class MockMitutoyoHub:
@@ -93,29 +95,29 @@ class MockMitutoyoHub:
             math.nan,
             math.nan,
         ],
+        log=None,
     ):
         self.positions = positions
         if len(self.positions) != 8:
             raise Exception("positions must contain exactly 8 values.")
         self.commands = {str(i): self.get_position for i in range(1, 9)}
-        self.log = logging.getLogger(__name__)
-        self.log.info(self.commands)
+        if log is None:
+            self.log = logging.getLogger(__name__)
+        else:
+            self.log = log
 
     def parse_message(self, msg):
-        self.log.info(msg)
+        self.log.debug("Parsing %r", msg)
         msg = msg.decode().rstrip("\r\n")
-        self.log.info(msg)
         # raise Exception("Intentional Failure")
         if msg in self.commands.keys():
             reply = self.commands[msg](msg)
             if reply is not None:
-                self.log.info(reply)
                 return reply
         raise NotImplementedError(f"{msg} not implemented.")
 
     def get_position(self, index):
         slot_position = self.positions[int(index) - 1]
-        self.log.info(slot_position)
         if not math.isnan(slot_position):
             return f"{index}:{slot_position:+f}\r"
         else:
@@ -0,0 +1,111 @@
+# This file is part of ts_pmd.
+#
+# Developed for the Vera Rubin Telescope and Site Project.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["AdaptiveInterval"]
+
+import math
+
+
+class AdaptiveInterval:
+    """Compute the telemetry polling interval from detected motion.
+
+    The interval drops to ``min_interval`` as soon as the rate of change of
+    any slot exceeds ``threshold`` and grows back by ``decay`` each cycle
+    once the readings settle, up to ``max_interval``.
+
+    The rate of change is always measured against a reference reading at
+    least ``max_interval`` old, so it does not depend on the polling
+    interval; otherwise measurement noise, divided by the short fast-rate
+    interval, would keep the polling fast after motion stops.
+
+    Parameters
+    ----------
+    max_interval : `float`
+        The slow polling interval used while static. (Seconds)
+    min_interval : `float`
+        The fast polling interval used while moving. (Seconds)
+    threshold : `float`
+        The rate of change above which a slot is considered to be moving.
+        (Units per second)
+    decay : `float`, optional
+        The factor by which the interval grows each settled cycle;
+        must be larger than 1.
+
+    Attributes
+    ----------
+    interval : `float`
+        The current polling interval. (Seconds)
+    moving : `bool`
+        Was motion detected in the latest measurement window?
+    """
+
+    def __init__(self, max_interval, min_interval, threshold, decay=2.0):
+        if min_interval > max_interval:
+            raise ValueError(
+                f"min_interval={min_interval} must not be larger than "
+                f"max_interval={max_interval}"
+            )
+        if decay <= 1:
+            raise ValueError(f"decay={decay} must be larger than 1")
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self.threshold = threshold
+        self.decay = decay
+        self.interval = max_interval
+        self.moving = False
+        self._reference_position = None
+        self._reference_timestamp = None
+
+    def update(self, position, timestamp):
+        """Update the interval from new readings.
+
+        Parameters
+        ----------
+        position : `list` of `float`
+            The slot positions; NaN values are ignored.
+        timestamp : `float`
+            The time of the readings. (Seconds)
+
+        Returns
+        -------
+        interval : `float`
+            The interval to wait before the next poll. (Seconds)
+        """
+        if self._reference_position is None:
+            self._reference_position = position
+            self._reference_timestamp = timestamp
+        elif timestamp - self._reference_timestamp >= self.max_interval:
+            dt = timestamp - self._reference_timestamp
+            self.moving = False
+            for previous, current in zip(self._reference_position, position):
+                if math.isnan(previous) or math.isnan(current):
+                    continue
+                if abs(current - previous) / dt > self.threshold:
+                    self.moving = True
+                    break
+            self._reference_position = position
+            self._reference_timestamp = timestamp
+
+        if self.moving:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.decay, self.max_interval)
+        return self.interval
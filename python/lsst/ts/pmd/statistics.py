@@ -0,0 +1,228 @@
+# This file is part of ts_pmd.
+#
+# Developed for the Vera Rubin Telescope and Site Project.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["SlotStatistics", "PositionStatistics"]
+
+import math
+
+
+class SlotStatistics:
+    """Single-pass statistics of the readings of one slot.
+
+    The accumulators are updated with Welford's algorithm, so memory and
+    CPU cost per sample are constant regardless of the window length.
+
+    Attributes
+    ----------
+    count : `int`
+        The number of valid (non-NaN) samples accumulated.
+    mean : `float`
+        The running mean of the samples.
+    min : `float`
+        The smallest sample seen.
+    max : `float`
+        The largest sample seen.
+    first_time : `float`
+        The time of the first valid sample, or NaN if none.
+    last_time : `float`
+        The time of the latest valid sample, or NaN if none.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = math.nan
+        self.min = math.nan
+        self.max = math.nan
+        self.first_time = math.nan
+        self.last_time = math.nan
+        self._m2 = 0.0
+        # Accumulators for the least-squares slope of value versus time.
+        self._mean_time = 0.0
+        self._m2_time = 0.0
+        self._co_moment = 0.0
+        # Accumulators for the Allan variance at the sampling interval.
+        self._last_value = math.nan
+        self._diff_count = 0
+        self._diff_sq_sum = 0.0
+        self._diff_time_sum = 0.0
+
+    def add(self, value, timestamp):
+        """Add a sample.
+
+        NaN values (an empty or timed out slot) are ignored, except that
+        the Allan variance does not take a difference across them.
+
+        Parameters
+        ----------
+        value : `float`
+            The slot reading.
+        timestamp : `float`
+            The time of the reading. (Seconds)
+        """
+        if math.isnan(value):
+            self._last_value = math.nan
+            return
+        previous_time = self.last_time
+        self.last_time = timestamp
+        if self.count == 0:
+            self.mean = value
+            self.min = value
+            self.max = value
+            self.first_time = timestamp
+            self._mean_time = timestamp
+            self.count = 1
+            self._last_value = value
+            return
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        delta_time = timestamp - self._mean_time
+        self._mean_time += delta_time / self.count
+        self._m2_time += delta_time * (timestamp - self._mean_time)
+        self._co_moment += delta_time * (value - self.mean)
+
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if not math.isnan(self._last_value):
+            self._diff_count += 1
+            self._diff_sq_sum += (value - self._last_value) ** 2
+            self._diff_time_sum += timestamp - previous_time
+        self._last_value = value
+
+    @property
+    def variance(self):
+        """The sample variance, or NaN if fewer than two samples."""
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stddev(self):
+        """The sample standard deviation, or NaN if fewer than two
+        samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def tau(self):
+        """The mean interval between consecutive valid samples, which is
+        the averaging time of `allan_deviation`, or NaN if there are no
+        two consecutive valid samples. (Seconds)"""
+        if self._diff_count == 0:
+            return math.nan
+        return self._diff_time_sum / self._diff_count
+
+    @property
+    def allan_deviation(self):
+        """The Allan deviation at the sampling interval `tau`, or NaN if
+        there are no two consecutive valid samples."""
+        if self._diff_count == 0:
+            return math.nan
+        return math.sqrt(0.5 * self._diff_sq_sum / self._diff_count)
+
+    @property
+    def drift(self):
+        """The least-squares slope of the readings versus time, or NaN if
+        it cannot be determined. (Units per second)"""
+        if self.count < 2 or self._m2_time == 0:
+            return math.nan
+        return self._co_moment / self._m2_time
+
+    def as_dict(self):
+        """Return the summary as a `dict`."""
+        return dict(
+            count=self.count,
+            mean=self.mean,
+            stddev=self.stddev,
+            min=self.min,
+            max=self.max,
+            tau=self.tau,
+            allanDeviation=self.allan_deviation,
+            drift=self.drift,
+        )
+
+
+class PositionStatistics:
+    """Single-pass statistics of the readings of all slots of a hub.
+
+    Parameters
+    ----------
+    num_slots : `int`, optional
+        The number of slots of the hub.
+    min_interval : `float`, optional
+        Readings less than this long after the previous accepted reading
+        are ignored, so that the statistics are sampled at a fixed rate
+        even if the telemetry loop polls faster. (Seconds)
+
+    Attributes
+    ----------
+    slots : `list` of `SlotStatistics`
+        The statistics of each slot.
+    start_time : `float`
+        The time of the first sample, or NaN if no sample was added.
+    end_time : `float`
+        The time of the latest sample, or NaN if no sample was added.
+    """
+
+    def __init__(self, num_slots=8, min_interval=0):
+        self.slots = [SlotStatistics() for _ in range(num_slots)]
+        self.min_interval = min_interval
+        self.start_time = math.nan
+        self.end_time = math.nan
+
+    def add(self, position, timestamp):
+        """Add the readings of one telemetry cycle.
+
+        Parameters
+        ----------
+        position : `list` of `float`
+            The slot positions, as returned by
+            `MitutoyoComponent.get_slots_position`.
+        timestamp : `float`
+            The time of the readings. (Seconds)
+        """
+        if math.isnan(self.start_time):
+            self.start_time = timestamp
+        elif timestamp - self.end_time < self.min_interval:
+            return
+        self.end_time = timestamp
+        for slot, value in zip(self.slots, position):
+            slot.add(value, timestamp)
+
+    @property
+    def duration(self):
+        """The time spanned by the accumulated samples. (Seconds)"""
+        if math.isnan(self.start_time):
+            return 0.0
+        return self.end_time - self.start_time
+
+    def summary(self):
+        """Return the summary of every slot.
+
+        Returns
+        -------
+        summary : `list` of `dict`
+            The `SlotStatistics.as_dict` of each slot.
+        """
+        return [slot.as_dict() for slot in self.slots]
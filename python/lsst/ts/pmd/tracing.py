@@ -0,0 +1,191 @@
+# This file is part of ts_pmd.
+#
+# Developed for the Vera Rubin Telescope and Site Project.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["Tracer"]
+
+import asyncio
+import collections
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+# Returned by Tracer.span when tracing is disabled, so that a disabled
+# span costs one attribute check and no span object or event. Keyword
+# arguments of the call are still built by the caller.
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    """A span being recorded by a `Tracer`."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": self.tracer.pid,
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        self.tracer.events.append(event)
+        return False
+
+
+class Tracer:
+    """Record begin/end spans in Chrome trace event format.
+
+    Spans are kept in a bounded in-memory buffer and appended to a file in
+    the Chrome trace JSON array format, which can be opened with
+    ``chrome://tracing`` or https://ui.perfetto.dev.
+
+    Parameters
+    ----------
+    enabled : `bool`, optional
+        Record spans? If false, `span` returns a shared no-op context
+        manager.
+    path : `str` or `None`, optional
+        The trace file. Required if ``enabled`` is true.
+    flush_interval : `float`, optional
+        The minimum interval between flushes by `flush_if_due`. (Seconds)
+    max_events : `int`, optional
+        The maximum number of buffered spans; the oldest are discarded
+        if the buffer is not flushed in time.
+    log : `logging.Logger`, optional
+        The parent logger.
+
+    Attributes
+    ----------
+    events : `collections.deque` of `dict`
+        Spans recorded since the last flush.
+    """
+
+    def __init__(
+        self, enabled=False, path=None, flush_interval=10, max_events=100000, log=None
+    ):
+        if enabled and not path:
+            raise ValueError("A path is required when tracing is enabled")
+        if log is None:
+            self.log = logging.getLogger(type(self).__name__)
+        else:
+            self.log = log.getChild(type(self).__name__)
+        self.enabled = enabled
+        self.path = path
+        self.flush_interval = flush_interval
+        self.pid = os.getpid()
+        self.events = collections.deque(maxlen=max_events)
+        self._last_flush = time.monotonic()
+        self._write_lock = threading.Lock()
+
+    def span(self, name, category="pmd", **args):
+        """Return a context manager that records a span.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the span.
+        category : `str`, optional
+            The category of the span.
+        **args
+            Extra values shown with the span, e.g. the slot.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    async def flush_if_due(self):
+        """Flush the buffered spans if ``flush_interval`` has elapsed since
+        the last flush.
+
+        The spans are serialized and written in a thread, so a large
+        buffer does not block the event loop.
+        """
+        if self.enabled and time.monotonic() - self._last_flush >= self.flush_interval:
+            events = self._take_events()
+            if events:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._write, events)
+
+    def flush(self):
+        """Append the buffered spans to the trace file, blocking until they
+        are written.
+
+        The closing bracket of the array is omitted, as allowed by the
+        Chrome trace format, so later flushes can append to the same file.
+        If the file cannot be written, a warning is logged and tracing is
+        disabled; tracing never raises.
+        """
+        events = self._take_events()
+        if events:
+            self._write(events)
+
+    def _take_events(self):
+        """Return the buffered spans and start a new buffer."""
+        self._last_flush = time.monotonic()
+        if not self.enabled or not self.events:
+            return None
+        events = self.events
+        self.events = collections.deque(maxlen=events.maxlen)
+        return events
+
+    def _write(self, events):
+        """Append spans to the trace file.
+
+        Parameters
+        ----------
+        events : `collections.deque` of `dict`
+            The spans to write.
+        """
+        try:
+            with self._write_lock:
+                new_file = (
+                    not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                )
+                with open(self.path, "a") as f:
+                    if new_file:
+                        f.write("[\n")
+                    for event in events:
+                        f.write(json.dumps(event))
+                        f.write(",\n")
+        except OSError as e:
+            self.log.warning(
+                f"Could not write trace file {self.path}; disabling tracing: {e}"
+            )
+            self.enabled = False
@@ -0,0 +1,72 @@
+import unittest
+import logging
+
+from lsst.ts.pmd.component import MitutoyoComponent
+
+
+class MitutoyoComponentTestCase(unittest.TestCase):
+    def setUp(self):
+        self.log = logging.getLogger("test_component")
+        self.log.setLevel(logging.INFO)
+        self.component = MitutoyoComponent(1, log=self.log)
+        self.addCleanup(self.component.configure_logging, {"rate_limit": 0})
+
+    def make_config(self, **kwargs):
+        config = {
+            "devices": ["Dial Gauge 1", "Dial Gauge 2", "Dial Gauge 3"],
+            "hub_type": "Mitutoyo",
+            "units": "um",
+            "location": "Office",
+            "serial_port": "/dev/ttyUSB0",
+        }
+        config.update(kwargs)
+        return config
+
+    def test_debug_single_slot(self):
+        self.component.configure(
+            self.make_config(logging={"component_level": "INFO", "debug_slots": [2]})
+        )
+        self.component.connect()
+        self.addCleanup(self.component.disconnect)
+
+        # assertLogs lowers the parent to DEBUG, as a verbose CSC would be.
+        with self.assertLogs(self.log, level=logging.DEBUG) as cm:
+            for i in range(20):
+                self.component.get_slots_position()
+        debug_records = [
+            record for record in cm.records if record.levelno == logging.DEBUG
+        ]
+        self.assertGreater(len(debug_records), 0)
+        slot2_name = f"{self.component.log.name}.slot2"
+        self.assertEqual({record.name for record in debug_records}, {slot2_name})
+        # Rate limited to 10 records per message per second.
+        for msg in {record.msg for record in debug_records}:
+            num_records = len([r for r in debug_records if r.msg == msg])
+            self.assertLessEqual(num_records, 10)
+
+    def test_levels_reset_on_reconfigure(self):
+        self.component.configure(
+            self.make_config(
+                logging={
+                    "component_level": "WARNING",
+                    "mock_level": "ERROR",
+                    "debug_slots": [1, 3],
+                }
+            )
+        )
+        self.assertEqual(self.component.log.level, logging.WARNING)
+        self.assertEqual(self.component.mock_log.level, logging.ERROR)
+        self.assertEqual(
+            [log.level for log in self.component.slot_logs],
+            [logging.DEBUG, logging.NOTSET, logging.DEBUG] + [logging.NOTSET] * 5,
+        )
+
+        # The loggers are process-global, so a new component must reset them.
+        component = MitutoyoComponent(1, log=self.log)
+        component.configure(self.make_config())
+        for log in [component.log, component.mock_log] + component.slot_logs:
+            self.assertEqual(log.level, logging.NOTSET)
+
+
+if __name__ == "__main__":
+    unittest.main()
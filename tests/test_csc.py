@@ -3,6 +3,8 @@ import math
 
 from lsst.ts import salobj, pmd
 
+STD_TIMEOUT = 10  # standard timeout (sec)
+
 
 class PMDCscTestCase(unittest.IsolatedAsyncioTestCase, salobj.BaseCscTestCase):
     def basic_make_csc(
@@ -52,6 +54,27 @@ class PMDCscTestCase(unittest.IsolatedAsyncioTestCase, salobj.BaseCscTestCase):
             self.assertTrue(math.isnan(position.position[6]))
             self.assertTrue(math.isnan(position.position[7]))
 
+    async def test_statistics(self):
+        async with self.make_csc(
+            initial_state=salobj.State.ENABLED,
+            index=1,
+            simulation_mode=1,
+            settings_to_apply="current",
+        ):
+            await self.remote.tel_position.next(flush=True, timeout=STD_TIMEOUT)
+            self.csc.start_statistics()
+            for i in range(3):
+                await self.remote.tel_position.next(flush=True, timeout=STD_TIMEOUT)
+            summary = self.csc.stop_statistics()
+            self.assertIsNone(self.csc.statistics)
+            self.assertEqual(len(summary), 8)
+            self.assertGreater(summary[0]["count"], 0)
+            self.assertAlmostEqual(summary[0]["mean"], 9e-05)
+            for slot_summary in summary[1:]:
+                self.assertEqual(slot_summary["count"], 0)
+            with self.assertRaises(RuntimeError):
+                self.csc.stop_statistics()
+
     async def test_metadata(self):
         async with self.make_csc(
             initial_state=salobj.State.DISABLED,
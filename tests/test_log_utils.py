@@ -0,0 +1,69 @@
+import unittest
+import logging
+from unittest import mock
+
+from lsst.ts.pmd.log_utils import RateLimitFilter, set_rate_limit
+
+
+class RateLimitFilterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.log = logging.getLogger("test_log_utils")
+        self.log.setLevel(logging.DEBUG)
+        self.addCleanup(set_rate_limit, self.log, 0)
+
+    def test_rate_limit(self):
+        set_rate_limit(self.log, 3)
+        with self.assertLogs(self.log, level=logging.DEBUG) as cm:
+            for i in range(10):
+                self.log.debug("Read %s", i)
+                self.log.debug("Write %s", i)
+            self.log.warning("Not rate limited")
+            self.log.warning("Not rate limited")
+        messages = [record.getMessage() for record in cm.records]
+        self.assertEqual(
+            messages,
+            ["Read 0", "Write 0", "Read 1", "Write 1", "Read 2", "Write 2"]
+            + ["Not rate limited"] * 2,
+        )
+        (log_filter,) = self.log.filters
+        self.assertEqual(log_filter.suppressed, 14)
+
+    def test_report_suppressed(self):
+        with mock.patch("lsst.ts.pmd.log_utils.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            set_rate_limit(self.log, 2)
+            (log_filter,) = self.log.filters
+            with self.assertLogs(self.log, level=logging.DEBUG) as cm:
+                for i in range(5):
+                    self.log.debug("Read %s", i)
+                # "Read" stops; another message sweeps its expired window.
+                monotonic.return_value = 1.5
+                self.log.debug("Write %s", 0)
+            self.assertEqual(list(log_filter._windows), [(self.log.name, "Write %s")])
+        messages = [record.getMessage() for record in cm.records]
+        self.assertEqual(
+            messages,
+            ["Read 0", "Read 1", "Suppressed 3 'Read %s' messages", "Write 0"],
+        )
+
+    def test_report_on_removal(self):
+        set_rate_limit(self.log, 1)
+        with self.assertLogs(self.log, level=logging.DEBUG) as cm:
+            for i in range(3):
+                self.log.debug("Read %s", i)
+            set_rate_limit(self.log, 0)
+        messages = [record.getMessage() for record in cm.records]
+        self.assertEqual(messages, ["Read 0", "Suppressed 2 'Read %s' messages"])
+
+    def test_set_rate_limit(self):
+        set_rate_limit(self.log, 3)
+        set_rate_limit(self.log, 5)
+        self.assertEqual(len(self.log.filters), 1)
+        self.assertIsInstance(self.log.filters[0], RateLimitFilter)
+        self.assertEqual(self.log.filters[0].rate, 5)
+        set_rate_limit(self.log, 0)
+        self.assertEqual(self.log.filters, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import math
+
+from lsst.ts.pmd.polling import AdaptiveInterval
+
+
+def make_position(value):
+    return [value] + [math.nan] * 7
+
+
+class AdaptiveIntervalTestCase(unittest.TestCase):
+    def test_interval(self):
+        adaptive = AdaptiveInterval(
+            max_interval=1, min_interval=0.1, threshold=1, decay=2
+        )
+        self.assertEqual(adaptive.update(make_position(0.0), 0.0), 1)
+        self.assertEqual(adaptive.update(make_position(0.0), 1.0), 1)
+
+        # Moves 5 units in 1 second, above the threshold; polling stays
+        # fast for at least one measurement window.
+        self.assertEqual(adaptive.update(make_position(5.0), 2.0), 0.1)
+        self.assertEqual(adaptive.update(make_position(5.0), 2.5), 0.1)
+
+        # Settled; the interval decays back to the slow rate.
+        self.assertAlmostEqual(adaptive.update(make_position(5.0), 3.0), 0.2)
+        self.assertAlmostEqual(adaptive.update(make_position(5.0), 3.2), 0.4)
+        self.assertAlmostEqual(adaptive.update(make_position(5.0), 3.6), 0.8)
+        self.assertAlmostEqual(adaptive.update(make_position(5.0), 4.4), 1)
+
+    def test_noise_after_move(self):
+        adaptive = AdaptiveInterval(
+            max_interval=1, min_interval=0.1, threshold=1, decay=2
+        )
+        timestamp = 0.0
+        value = 0.0
+        intervals = []
+        # A gauge flickering by one unit while static.
+        for i in range(5):
+            value = 1.0 - value
+            intervals.append(adaptive.update(make_position(value), timestamp))
+            timestamp += intervals[-1]
+        self.assertEqual(intervals, [1] * 5)
+
+        # One real move, then flicker again.
+        value = 10.0
+        for i in range(40):
+            intervals.append(adaptive.update(make_position(value), timestamp))
+            timestamp += intervals[-1]
+            value = 21.0 - value
+        self.assertEqual(intervals[5], 0.1)
+        self.assertEqual(intervals[-5:], [1] * 5)
+
+    def test_nan_ignored(self):
+        adaptive = AdaptiveInterval(
+            max_interval=1, min_interval=0.1, threshold=1, decay=2
+        )
+        adaptive.update([math.nan] * 8, 0.0)
+        self.assertEqual(adaptive.update(make_position(100.0), 1.0), 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AdaptiveInterval(max_interval=0.1, min_interval=1, threshold=1)
+        with self.assertRaises(ValueError):
+            AdaptiveInterval(max_interval=1, min_interval=0.1, threshold=1, decay=0.5)
+        with self.assertRaises(ValueError):
+            AdaptiveInterval(max_interval=1, min_interval=0.1, threshold=1, decay=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import math
+import statistics
+
+from lsst.ts.pmd.statistics import SlotStatistics, PositionStatistics
+
+
+class StatisticsTestCase(unittest.TestCase):
+    def test_slot_statistics(self):
+        values = [1.0, 3.0, 2.0, 5.0, 4.0, 6.0]
+        times = [10.0, 11.0, 12.0, 13.0, 14.0, 15.0]
+        slot = SlotStatistics()
+        for value, timestamp in zip(values, times):
+            slot.add(value, timestamp)
+        slot.add(math.nan, 16.0)
+
+        self.assertEqual(slot.count, len(values))
+        self.assertAlmostEqual(slot.mean, statistics.mean(values))
+        self.assertAlmostEqual(slot.variance, statistics.variance(values))
+        self.assertEqual(slot.min, 1.0)
+        self.assertEqual(slot.max, 6.0)
+
+        diffs = [b - a for a, b in zip(values[:-1], values[1:])]
+        expected_adev = math.sqrt(0.5 * statistics.mean(d**2 for d in diffs))
+        self.assertAlmostEqual(slot.allan_deviation, expected_adev)
+        self.assertAlmostEqual(slot.tau, 1.0)
+
+        mean_time = statistics.mean(times)
+        mean_value = statistics.mean(values)
+        expected_drift = sum(
+            (t - mean_time) * (v - mean_value) for t, v in zip(times, values)
+        ) / sum((t - mean_time) ** 2 for t in times)
+        self.assertAlmostEqual(slot.drift, expected_drift)
+
+    def test_gap(self):
+        slot = SlotStatistics()
+        for value, timestamp in [(1.0, 0.0), (2.0, 1.0), (math.nan, 2.0), (5.0, 3.0)]:
+            slot.add(value, timestamp)
+        self.assertEqual(slot.count, 3)
+        # Only the 1 -> 2 difference is used; 2 -> 5 spans the gap.
+        self.assertAlmostEqual(slot.tau, 1.0)
+        self.assertAlmostEqual(slot.allan_deviation, math.sqrt(0.5))
+
+    def test_empty_slot(self):
+        slot = SlotStatistics()
+        slot.add(math.nan, 0.0)
+        self.assertEqual(slot.count, 0)
+        for value in slot.as_dict().values():
+            if value != 0:
+                self.assertTrue(math.isnan(value))
+
+    def test_position_statistics(self):
+        stats = PositionStatistics()
+        for i in range(5):
+            stats.add([float(i)] + [math.nan] * 7, 100.0 + i)
+        self.assertEqual(stats.duration, 4.0)
+        summary = stats.summary()
+        self.assertEqual(len(summary), 8)
+        self.assertEqual(summary[0]["count"], 5)
+        self.assertAlmostEqual(summary[0]["mean"], 2.0)
+        self.assertAlmostEqual(summary[0]["drift"], 1.0)
+        self.assertEqual(summary[1]["count"], 0)
+
+    def test_min_interval(self):
+        stats = PositionStatistics(min_interval=0.95)
+        for i in range(21):
+            stats.add([float(i)] + [math.nan] * 7, i * 0.1)
+        summary = stats.summary()
+        self.assertEqual(summary[0]["count"], 3)
+        self.assertAlmostEqual(summary[0]["tau"], 1.0)
+        self.assertAlmostEqual(summary[0]["mean"], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
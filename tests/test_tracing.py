@@ -0,0 +1,88 @@
+import unittest
+import asyncio
+import json
+import pathlib
+import tempfile
+
+from lsst.ts.pmd.tracing import Tracer
+
+
+class TracerTestCase(unittest.TestCase):
+    def test_disabled(self):
+        tracer = Tracer()
+        with tracer.span("cycle"):
+            pass
+        self.assertEqual(len(tracer.events), 0)
+        tracer.flush()
+
+    def test_enabled_requires_path(self):
+        with self.assertRaises(ValueError):
+            Tracer(enabled=True)
+
+    def test_flush(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / "trace.json"
+            tracer = Tracer(enabled=True, path=str(path), max_events=10)
+            with tracer.span("cycle"):
+                with tracer.span("send_msg", slot=1):
+                    pass
+            tracer.flush()
+            self.assertEqual(len(tracer.events), 0)
+            with tracer.span("cycle"):
+                pass
+            tracer.flush()
+
+            # The closing bracket is omitted so the file can be appended to.
+            text = path.read_text()
+            events = json.loads(text.rstrip().rstrip(",") + "]")
+            self.assertEqual(
+                [event["name"] for event in events], ["send_msg", "cycle", "cycle"]
+            )
+            self.assertEqual(events[0]["args"], {"slot": 1})
+            self.assertEqual(events[0]["ph"], "X")
+            self.assertLessEqual(events[1]["ts"], events[0]["ts"])
+
+    def test_flush_if_due(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / "trace.json"
+            tracer = Tracer(enabled=True, path=str(path), flush_interval=1000)
+            with tracer.span("cycle"):
+                pass
+            asyncio.run(tracer.flush_if_due())
+            self.assertFalse(path.exists())
+
+            tracer.flush_interval = 0
+            asyncio.run(tracer.flush_if_due())
+            self.assertEqual(len(tracer.events), 0)
+            events = json.loads(path.read_text().rstrip().rstrip(",") + "]")
+            self.assertEqual([event["name"] for event in events], ["cycle"])
+
+    def test_unwritable_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir) / "missing_dir" / "trace.json"
+            tracer = Tracer(enabled=True, path=str(path))
+            with tracer.span("cycle"):
+                pass
+            with self.assertLogs(tracer.log, level="WARNING"):
+                tracer.flush()
+            self.assertFalse(tracer.enabled)
+            self.assertFalse(path.exists())
+            with tracer.span("cycle"):
+                pass
+            self.assertEqual(len(tracer.events), 0)
+            # Further flushes are no-ops.
+            tracer.flush()
+
+    def test_max_events(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracer = Tracer(enabled=True, path=f"{tmpdir}/trace.json", max_events=3)
+            for i in range(5):
+                with tracer.span("cycle", index=i):
+                    pass
+            self.assertEqual(
+                [event["args"]["index"] for event in tracer.events], [2, 3, 4]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
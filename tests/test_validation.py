@@ -31,6 +31,56 @@ class ValidationTestCase(unittest.TestCase):
         for field, value in data.items():
             self.assertEqual(result[field], value)
 
+    def test_adaptive_polling(self):
+        data = {
+            "hub_config": [
+                {
+                    "sal_index": 1,
+                    "telemetry_interval": 1,
+                    "devices": ["Dial Gage"],
+                    "units": "um",
+                    "location": "Office",
+                    "serial_port": "/dev/ttyUSB0",
+                    "hub_type": "Mitutoyo",
+                    "adaptive_polling": {"enabled": True, "min_interval": 0.05},
+                }
+            ]
+        }
+        result = self.validator.validate(data)
+        adaptive_polling = result["hub_config"][0]["adaptive_polling"]
+        self.assertTrue(adaptive_polling["enabled"])
+        self.assertEqual(adaptive_polling["min_interval"], 0.05)
+
+        data["hub_config"][0]["adaptive_polling"]["min_interval"] = 0
+        with self.assertRaises(jsonschema.exceptions.ValidationError):
+            self.validator.validate(data)
+
+    def test_logging(self):
+        data = {
+            "hub_config": [
+                {
+                    "sal_index": 1,
+                    "telemetry_interval": 1,
+                    "devices": ["Dial Gage"],
+                    "units": "um",
+                    "location": "Office",
+                    "serial_port": "/dev/ttyUSB0",
+                    "hub_type": "Mitutoyo",
+                    "logging": {"mock_level": "WARNING", "debug_slots": [2]},
+                }
+            ]
+        }
+        result = self.validator.validate(data)
+        logging_config = result["hub_config"][0]["logging"]
+        self.assertEqual(logging_config["mock_level"], "WARNING")
+        self.assertEqual(logging_config["debug_slots"], [2])
+        self.assertEqual(logging_config["rate_limit"], 10)
+
+        for bad_logging in ({"component_level": "LOUD"}, {"debug_slots": [9]}):
+            data["hub_config"][0]["logging"] = bad_logging
+            with self.assertRaises(jsonschema.exceptions.ValidationError):
+                self.validator.validate(data)
+
     def test_invalid_configs(self):
         good_data = {
             "hub_config": [